@@ -19,7 +19,7 @@ Package overview:
    view. The :any:`ObsList` is toolkit-agnostic and has has lots of hooks where
    the GUI bindings (in the ``toolkit_`` modules) connect to.
 '''
-from .autoframe import AutoFrame
+from .autoframe import AutoFrame, prewarm
 from .toolkit import set_toolkit
 # EventSource kept to support legacy code.
 from .event import event, Event, EventSource, CancelEvent
@@ -31,6 +31,7 @@ __version__ = "0.6.0"
 __all__ = [
     '__version__',
     'AutoFrame',
+    'prewarm',
     'set_toolkit',
     'event',
     'Event',
@@ -12,7 +12,9 @@ Rows are merged by prefixing the cells with ``{``. The symbols must be in the
 same text column.
 '''
 import attr
-import textwrap
+import functools
+import itertools
+import os
 
 __all__ = [
     'slice_grid',
@@ -38,7 +40,7 @@ _adj_row_merge = '''
      {pqr
      '''
      
-@attr.s
+@attr.s(slots=True)
 class SlicedGrid:
     # text between (not including) | | splitters
     column_heads = attr.ib(attr.Factory(list))
@@ -48,6 +50,23 @@ class SlicedGrid:
     body_lines = attr.ib(attr.Factory(list))
 
 
+def _dedented_lines(text):
+    '''Split text into lines and remove common leading whitespace.
+
+    Same result as ``textwrap.dedent(text).splitlines()``, except that a
+    trailing whitespace-only line is kept (as empty line).
+    '''
+    # Like textwrap.dedent, only spaces and tabs count as indentation.
+    lines = [line if line.strip(' \t') else '' for line in text.splitlines()]
+    indent = len(os.path.commonprefix([
+        line[:len(line) - len(line.lstrip(' \t'))] for line in lines if line
+    ]))
+    if indent:
+        lines = [line[indent:] for line in lines]
+    return lines
+
+
+@functools.lru_cache(maxsize=128)
 def slice_grid(grid_text):
     '''slice a grid up by the first (nonempty) row.
     
@@ -62,9 +81,12 @@ def slice_grid(grid_text):
         * body_lines: list of following lines; each item is a list of strings, 
           where each string is the grid "cell" including the preceding separator column.
           I.e. if you join the cell list without separator, you regain the text line.
+
+    Results are cached per ``grid_text``, since form bodies are usually
+    class-level constants. The returned ``SlicedGrid`` is shared between
+    callers and must not be modified.
     '''
-    grid_text = textwrap.dedent(grid_text)
-    lines = grid_text.splitlines()
+    lines = _dedented_lines(grid_text)
     # remove leading and trailing whitespace lines
     while lines and not lines[0].strip():
         lines.pop(0)
@@ -85,18 +107,18 @@ def slice_grid(grid_text):
     maxlen = max((len(line) for line in lines), default=0)
     widths[-1] = max(widths[-1], maxlen-sum(widths[:-1]))
 
+    # cell boundaries as (start, stop) text columns
+    stops = list(itertools.accumulate(widths))
+    bounds = list(zip([0] + stops[:-1], stops))
+    # Every line is padded to full width once, so that cells can be cut
+    # out directly instead of repeatedly splitting off the line's rest.
     body_lines = []
     for line in lines:
-        body_line = []
-        for w in widths[:]:
-            cell, line = line[:w], line[w:]
-            if len(cell) < w:
-                cell = cell + ' '*(w-len(cell))
-            body_line.append(cell)
-        body_lines.append(body_line)
+        line = line.ljust(stops[-1])
+        body_lines.append([line[start:stop] for start, stop in bounds])
     return SlicedGrid(column_heads=column_heads, body_lines=body_lines)
 
-@attr.s
+@attr.s(slots=True)
 class MCell:
     row = attr.ib()
     col = attr.ib()
@@ -105,7 +127,7 @@ class MCell:
     colspan = attr.ib(1)
 
 
-def merged_cells(sliced_grid):
+def merged_cells(sliced_grid, skip_empty=False):
     '''Generator: takes the sliced grid, and returns merged cells one by one.
     
     Cells are merged by the following logic:
@@ -123,70 +145,82 @@ def merged_cells(sliced_grid):
         including the leading '{'; "ragged" linebreaks retained.
             
     Iteration order is row-wise.
+
+    If ``skip_empty`` is set, merge areas containing only whitespace are not
+    yielded.
     
     Merge areas must not overlap. (However this should rarely happen on accident).
     
     Note: If you need two row-merge ranges above each other, indent the 
     '{' differently.
     '''
-    # make a deep copy first
-    body_lines = [ cells[:] for cells in sliced_grid.body_lines ]
+    body_lines = sliced_grid.body_lines
+    nrows = len(body_lines)
+    ncols = len(body_lines[0]) if body_lines else 0
+    # Precomputed once: True where the cell starts with space or '|', i.e.
+    # column merging stops there.
+    is_sep = [
+        [cell[:1] in (' ', '|') for cell in cells]
+        for cells in body_lines
+    ]
+    # Flag per cell (index row*ncols + col): part of a previous merge area.
+    # The input grid itself is left untouched.
+    consumed = bytearray(nrows*ncols)
     for row, line in enumerate(body_lines):
         for col, cell in enumerate(line):
             rowspan = 1
             colspan = 1
-            if cell is None:
+            if consumed[row*ncols+col]:
                 # part of previously merged cell
                 continue
             cell = cell[1:]
             # calculate Row span
             ofs = 0
-            if cell.lstrip().startswith('{'):
-                ofs = cell.index('{')+1
+            stripped = cell.lstrip()
+            if stripped[:1] == '{':
+                ofs = len(cell) - len(stripped) + 1
             if ofs:
-                while True:
-                    try:
-                        cell_below = body_lines[row+rowspan][col][1:]
-                    except IndexError:
-                        break
+                while row+rowspan < nrows and not consumed[(row+rowspan)*ncols+col]:
+                    cell_below = body_lines[row+rowspan][col][1:]
                     # no aligned { or not empty before
                     if cell_below[ofs-1:ofs] != '{' or cell_below[:ofs-1].strip():
                         break
                     rowspan += 1
-                # now we talked about it, delete prefix
-                for row2 in range(row, row+rowspan):
-                    body_lines[row2][col] = body_lines[row2][col][ofs:]
-                cell = cell[ofs:]
             # calculate column_span
             colspans = [] # collect for merged rows
             for row2 in range(row, row+rowspan):
+                base, seps = row2*ncols, is_sep[row2]
                 colspan = 1
-                while True:
-                    try:
-                        cell_right = body_lines[row2][col+colspan]
-                    except IndexError:
-                        break
-                    # "not cell" also covers the "already-merged" case.
-                    if (not cell_right) or cell_right.startswith(' ') or cell_right.startswith('|'):
-                        break
+                while (
+                    col+colspan < ncols
+                    and not consumed[base+col+colspan]
+                    and not seps[col+colspan]
+                ):
                     colspan += 1
                 colspans.append(colspan)
             colspan = max(colspans)
             # All clear. Collect text.
-            try:
+            for row2 in range(row, row+rowspan):
+                base = row2*ncols
+                if any(consumed[base+col:base+col+colspan]):
+                    raise ValueError('Overlapping merge areas')
+            # Checked cell by cell, to avoid joining the text. A blank area
+            # can span columns, e.g. if a cell starts with a tab.
+            blank = skip_empty and not any(
+                body_lines[row2][col][ofs+1:].strip()
+                or any(c.strip() for c in body_lines[row2][col+1:col+colspan])
+                for row2 in range(row, row+rowspan)
+            )
+            if not blank:
+                # On row merge, the prefix up to '{' is cut off. The '{' then
+                # takes the place of the separator column, which is removed.
                 mrows = [
-                    ''.join(body_lines[row2][col:col+colspan])[1:]
+                    (body_lines[row2][col][ofs:] + ''.join(body_lines[row2][col+1:col+colspan]))[1:]
                     for row2 in range(row, row+rowspan)
                 ]
-            except TypeError as e:
-                # caught a None entry
-                raise ValueError('Overlapping merge areas') from e
-            text = '\n'.join(mrows)
-            yield MCell(row=row, col=col, text=text, rowspan=rowspan, colspan=colspan)
+                text = '\n'.join(mrows)
+                yield MCell(row=row, col=col, text=text, rowspan=rowspan, colspan=colspan)
             # white-out merge area
             for row2 in range(row, row+rowspan):
-                for col2 in range(col, col+colspan):
-                    try:
-                        body_lines[row2][col2] = None
-                    except IndexError:
-                        pass
+                base = row2*ncols
+                consumed[base+col:base+col+colspan] = b'\x01'*colspan
@@ -1,20 +1,81 @@
+import functools
 import logging
+import sys
+import weakref
 
 from .ascii_slice import slice_grid, merged_cells
 from .toolkit import get_toolkit
 
 __all__ = [
     'AutoFrame',
+    'prewarm',
     ]
 
 def L():
     return logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
 def _convert_title(classname):
-    # insert space before each capital letter
-    title = ''.join(map(lambda x: x if x.islower() else " "+x, classname))
-    title = title.strip()
-    return title
+    # insert space before each capital letter (any non-lowercase char)
+    return ''.join([ch if ch.islower() else ' '+ch for ch in classname]).strip()
+
+# class -> {widget id: handler name or None}
+# Kept here instead of on the class, since f_add_widgets accepts any object
+# as autoframe.
+_handler_names = weakref.WeakKeyDictionary()
+
+def _handler_name(cls, id):
+    '''Name of the ``cls`` member to autobind to widget ``id``.
+
+    That is ``id`` if it is a callable member, else ``on_<id>`` if that is
+    one, else None. Resolved once per class and id. Members added to the
+    class afterwards are not seen.
+    '''
+    try:
+        cache = _handler_names[cls]
+    except KeyError:
+        cache = _handler_names[cls] = {}
+    try:
+        return cache[id]
+    except KeyError:
+        name = cache[id] = next(
+            (name for name in (id, 'on_'+id) if callable(getattr(cls, name, None))),
+            None
+        )
+        return name
+
+def _with_anchors(grid_elements):
+    '''Yields ``(grid_element, anchor_left, anchor_right)`` for each element.
+
+    A widget is anchored at a side if its text has no space on that side.
+    '''
+    for grid_element in grid_elements:
+        text = grid_element.text.replace('~',' ')
+        yield grid_element, not text.startswith(' '), not text.endswith(' ')
+
+@functools.lru_cache(maxsize=128)
+def _body_cells(body):
+    '''Non-empty merged cells of the given body text with anchor flags, as
+    tuple (see `_with_anchors`).
+
+    Cached per body text, like ``slice_grid`` itself.
+    '''
+    return tuple(_with_anchors(merged_cells(slice_grid(body), skip_empty=True)))
+
+def prewarm(*frame_classes):
+    '''Slice the body definitions of the given AutoFrame classes in advance.
+
+    Call this at application startup, so that the first ``f_show`` of each
+    form does not need to parse its body and find its merge areas. All
+    string-valued class attributes whose name starts with ``f_body`` are
+    processed (e.g. ``f_body_editor`` used with ``f_add_widgets``).
+    '''
+    for cls in frame_classes:
+        for name in dir(cls):
+            if name.startswith('f_body'):
+                body = getattr(cls, name)
+                if isinstance(body, str):
+                    _body_cells(body)
 
 class AutoFrame:
     '''
@@ -80,26 +141,34 @@ class AutoFrame:
             self.label1 = tr(".msg_wait", "Please wait")
         """
 
+    @classmethod
+    def _f_translation_prefix(cls):
+        '''Prefix for this form's translation keys, i.e. ``<qualname>.``.
+
+        Computed once per class.
+        '''
+        prefix = cls.__dict__.get('_f_prefix')
+        if prefix is None:
+            prefix = cls._f_prefix = cls.__qualname__ + "."
+        return prefix
+
     def __init__(self):
         self.__dict__['f_controls'] = {}
         self.__dict__['f_toolkit'] = get_toolkit()
-        try:
-            title = self.f_title
-        except AttributeError:
-            self.f_title = _convert_title(self.__class__.__name__)
-        try:
-            menu = self.f_menu
-        except AttributeError:
+        # Defaults unless given by the class. Checking the class avoids
+        # going through __getattr__ and its AttributeError.
+        cls = type(self)
+        if not hasattr(cls, 'f_title'):
+            self.f_title = _convert_title(cls.__name__)
+        if not hasattr(cls, 'f_menu'):
             self.f_menu = []
-        try:
-            icon = self.f_icon
-        except AttributeError:
+        if not hasattr(cls, 'f_icon'):
             self.f_icon = ''
         
     def f_show(self):
         '''Bring the frame on the screen.'''
         if not self.f_controls:
-            prefix = self.__class__.__qualname__ + "."
+            prefix = self._f_translation_prefix()
             root = self.f_controls[''] = self.f_toolkit.root(
                 title=self.f_translations.get(prefix+"f_title", self.f_title),
                 icon=self.f_icon,
@@ -115,15 +184,15 @@ class AutoFrame:
         sliced_grid = slice_grid(body)
         
         # init rows / columns
+        col_stretch = self.f_toolkit.col_stretch
         for col, head in enumerate(sliced_grid.column_heads):
-            self.f_toolkit.col_stretch(parent, col, head.count('-'))
+            col_stretch(parent, col, head.count('-'))
+        row_stretch = self.f_toolkit.row_stretch
         for row, cells in enumerate(sliced_grid.body_lines):
-            # first cell
-            head = cells[0:1]
             # first char of first cell
-            if head: head = head[0][0:1]
-            self.f_toolkit.row_stretch(parent, row, 1 if head=='I' else 0)
-        self.f_add_widgets(parent, sliced_grid, autoframe=self)
+            head = cells[0][:1] if cells else ''
+            row_stretch(parent, row, 1 if head=='I' else 0)
+        self.f_add_widgets(parent, body=body, autoframe=self)
         self.f_on_build()
 
     def f_on_build(self):
@@ -173,64 +242,75 @@ class AutoFrame:
             menudef, 
             self,
             translations=self.f_translations,
-            translation_prefix = self.__class__.__qualname__ + "."
+            translation_prefix = self._f_translation_prefix()
         )
 
     def f_add_widgets(self, parent, sliced_grid=None, body=None, offset_row=0, offset_col=0, autoframe=None):
-        if not sliced_grid:
-            sliced_grid = slice_grid(body)
+        if sliced_grid:
+            grid_elements = _with_anchors(merged_cells(sliced_grid, skip_empty=True))
+        else:
+            grid_elements = _body_cells(body)
         toolkit = self.f_toolkit
         if hasattr(toolkit, "autovalidate"):
             toolkit.autovalidate = self.f_option_tk_autovalidate
         autoframe = autoframe or self
-        translation_prefix = self.__class__.__qualname__ + "."
+        autoframe_cls = type(autoframe)
+        instance_dict = getattr(autoframe, '__dict__', {})
+        translation_prefix = self._f_translation_prefix()
+        translations = self.f_translations
+        controls = self.f_controls
+        # bound methods as locals, looked up once instead of per widget
+        parse = toolkit.parse
+        place = toolkit.place
+        anchor = toolkit.anchor
+        connect = toolkit.connect
         
         # create controls
-        for grid_element in merged_cells(sliced_grid):
-            if not grid_element.text.strip():
-                continue
-            id, widget = toolkit.parse(
+        for e, anchor_left, anchor_right in grid_elements:
+            id, widget = parse(
                 parent,
-                grid_element.text,
-                translations=self.f_translations,
+                e.text,
+                translations=translations,
                 translation_prefix=translation_prefix
             )
                 
             # place on the grid
-            e = grid_element
-            toolkit.place(widget, row=e.row+offset_row, col=e.col+offset_col, rowspan=e.rowspan, colspan=e.colspan)
-            text = e.text.replace('~',' ')
-            toolkit.anchor(widget, left=not text.startswith(' '), right=not text.endswith(' '))
-            # autowire
-            try:
-                attr = getattr(autoframe, id)
-            except AttributeError:
-                attr = None
-            if attr is None or not callable(attr):
-                # try with "on_<attr>"
-                try:
-                    attr = getattr(autoframe, 'on_'+id)
-                except AttributeError:
-                    attr = None # not callable
-            if callable(attr):
-                toolkit.connect(widget, attr)
-            self.f_controls[id] = widget
+            place(widget, row=e.row+offset_row, col=e.col+offset_col, rowspan=e.rowspan, colspan=e.colspan)
+            anchor(widget, left=anchor_left, right=anchor_right)
+            # autowire: bind method named <id> or on_<id>, if any.
+            if id in instance_dict or 'on_'+id in instance_dict:
+                # instance attributes shadow class members: full lookup
+                for name in (id, 'on_'+id):
+                    attr = getattr(autoframe, name, None)
+                    if callable(attr):
+                        connect(widget, attr)
+                        break
+            else:
+                name = _handler_name(autoframe_cls, id)
+                if name:
+                    connect(widget, getattr(autoframe, name))
+            # Interned like attribute names, so that dict lookups from
+            # __getattr__ / __setattr__ can match by identity.
+            controls[sys.intern(id)] = widget
                 
         
     def __setattr__(self, name, val):
-        if name in self:
-            self.f_toolkit.setval(self[name], val)
-        else:
+        # This runs for *every* attribute assignment.
+        widget = self.f_controls.get(name)
+        if widget is None:
             super().__setattr__(name, val)
+        else:
+            self.f_toolkit.setval(widget, val)
     
     def __getattr__(self, name):
-        if 'f_controls' not in self.__dict__:
+        if name in ('f_controls', 'f_toolkit'):
+            # not set by __init__
             raise RuntimeError('You forgot to call super().__init__!')
-        if name in self.f_controls:
-            # use toolkit to extract value from the widget
-            return self.f_toolkit.getval(self[name])
-        else:
+        widget = self.f_controls.get(name)
+        if widget is None:
             raise AttributeError('Attribute %s is not defined'%(name,))
+        # use toolkit to extract value from the widget
+        return self.f_toolkit.getval(widget)
     
     def __getitem__(self, key):
         return self.f_controls[key]
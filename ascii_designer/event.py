@@ -11,6 +11,7 @@ __all__ = [
     "CancelEvent",
 ]
 
+import dis
 import inspect
 from functools import wraps, update_wrapper
 
@@ -19,14 +20,35 @@ try:
 except ImportError:
     Self = None
 
-from weakref import WeakValueDictionary
-# FIXME: Use weakref for listeners as well
+from weakref import WeakMethod, ref as weakref
+
+
+# marks "no result yet" in Event.__call__ (None is no result as well)
+_UNSET = object()
 
 
 class CancelEvent(Exception):
     """Raise this in an event handler to inhibit all further processing."""
 
 
+def _has_empty_body(func):
+    """True if ``func`` does nothing except returning ``None``, i.e. its body
+    is only a docstring and/or ``pass``."""
+    try:
+        code = func.__code__
+    except AttributeError:
+        return False
+    ops = [
+        (i.opname, i.argval)
+        for i in dis.get_instructions(code)
+        if i.opname not in ("RESUME", "NOP", "CACHE")
+    ]
+    return ops in (
+        [("LOAD_CONST", None), ("RETURN_VALUE", None)],
+        [("RETURN_CONST", None)],
+    )
+
+
 class Event:
     """Notifies a number of "listeners" (functions) when called.
 
@@ -63,6 +85,11 @@ class Event:
     Event listeners can be subscribed/unsubscribed using the ``+=`` and ``-=``
     operators. Listener signature is *not* checked at the time of subscription.
 
+    Bound methods are only weakly referenced: Subscribing
+    ``self.on_something`` does not keep ``self`` alive. When the object is
+    garbage-collected, the listener is unsubscribed automatically. Other
+    callables (functions, lambdas, ...) are kept alive by the event.
+
     ``by_name`` controls whether arguments are passed to the listeners as
     positional arguments (args) or as named arguments (kwargs). The latter is
     recommended.
@@ -83,7 +110,8 @@ class Event:
 
     First, the wrapped protoype is executed, in order to verify correct arguments.
     Note that adherence to annotated types is *not* checked, in line with
-    standard Python behavior.
+    standard Python behavior. The check can be turned off by setting
+    `validate_args` to ``False``.
 
     Then, arguments are normalized to be all-positional or all-named args,
     depending on the ``by_name`` setting. Listeners are then called with these
@@ -104,6 +132,14 @@ class Event:
         raised at the call (Trigger) site. Event-triggering function must be
         prepared to handle any exceptions thrown at it.
 
+    .. note::
+        Subscribing and unsubscribing replace the listener list as a whole.
+        They can safely happen while the event is being triggered, also from
+        another thread; a running trigger call sees the listeners as they
+        were when it started. (Concurrent subscriptions from several threads
+        still need a lock.) Listeners run in the thread triggering the
+        event; to update a GUI, trigger the event from the GUI thread.
+
     **``self`` argument**
 
     The wrapped method *can* have a ``self`` argument, which will simply be
@@ -121,6 +157,9 @@ class Event:
     does *not* inherit listeners from the unbound event. Typically, the *bound*
     event is the one you want to subscribe to.
 
+    Classes using ``__slots__`` must include ``__dict__`` or ``__weakref__``
+    in them, otherwise accessing the bound event raises ``TypeError``.
+
     Lastly, you can also apply ``@event`` to a module-level function. There will
     be only one, global list of subscribers, same as for an unbound event.
 
@@ -150,10 +189,21 @@ class Event:
                 self.update_display(new_value)
     """
 
+    validate_args: bool = True
+    """If True (default), the prototype is executed on each trigger to check
+    the arguments.
+
+    Can be set to False on the class (or a single ``Event``) to skip the check,
+    e.g. in production code with well-tested event calls. Prototypes that
+    contain actual code are still executed.
+    """
+
     def __init__(self, prototype=None, by_name=True):
         self._prototype = prototype
         self._by_name = by_name
-        self._listeners = []
+        # Immutable; replaced on (un)subscribe. Dispatch iterates a snapshot
+        # and is unaffected by listeners (un)subscribing meanwhile.
+        self._listeners = ()
         if self._prototype:
             sig: inspect.Signature = inspect.signature(self._prototype)
             P = inspect.Parameter
@@ -165,83 +215,187 @@ class Event:
             ):
                 raise TypeError("*args and **kwargs are forbidden for events")
             self._self_arg = "self" in sig.parameters
-            self._argnames = [
+            self._argnames = tuple(
                 p.name for p in sig.parameters.values() if p.name != "self"
-            ]
+            )
             update_wrapper(self, prototype)
+            # docstring-only prototype: only needs calling for validation
+            self._prototype_empty = _has_empty_body(prototype)
         else:
             self._self_arg = False
-            self._argnames = []
+            self._argnames = ()
+            self._prototype_empty = True
+        self._normalize = self._make_normalizer()
         self._is_bound = False
-        self._bound_copies = WeakValueDictionary()
+        # Attribute name in the owner class, see __set_name__.
+        self._name = prototype.__name__ if prototype else None
+        # Only used for owner instances without __dict__.
+        # id(instance) -> (instance reference, bound copy)
+        self._bound_copies = {}
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def _make_normalizer(self):
+        """Returns function ``(args, kwargs) -> (args, kwargs)`` converting
+        trigger arguments to all-named or all-positional form.
+
+        Chosen once, so that triggering does not need to decide every time.
+        """
+        argnames = self._argnames
+        if not self._prototype or not argnames:
+            # untyped event: pass on as given
+            # no arguments: nothing to convert (checked by prototype)
+            return lambda args, kwargs: (args, kwargs)
+        elif self._by_name:
+            def normalize_by_name(args, kwargs):
+                # convert args to kwargs
+                if not args:
+                    return (), kwargs
+                if not kwargs:
+                    return (), dict(zip(argnames, args))
+                kwargs = dict(kwargs)
+                kwargs.update(zip(argnames, args))
+                return (), kwargs
+            return normalize_by_name
+        else:
+            def normalize_by_pos(args, kwargs):
+                # convert kwargs to args
+                if not kwargs:
+                    return args, {}
+                args = list(args)
+                for name in argnames[len(args) :]:
+                    args.append(kwargs[name])
+                return args, {}
+            return normalize_by_pos
 
     def __get__(self, instance, owner):
         # Copy the event for each instance, so that that each instance
         # has its private list of listeners.
         if instance is None:
             return self
+        # The bound copy is stored in the instance's __dict__ under the
+        # event's own name. Since Event is a non-data descriptor, further
+        # attribute accesses find it there and do not call __get__ at all.
+        try:
+            instance_dict = instance.__dict__
+        except AttributeError:
+            instance_dict = None
+        if instance_dict is not None and self._name:
+            ev = instance_dict.get(self._name)
+            if ev is None:
+                ev = instance_dict[self._name] = self._bound_copy()
+            return ev
+        # Fallback for __slots__ classes
         key = id(instance)
         try:
-            return self._bound_copies[key]
+            return self._bound_copies[key][1]
         except KeyError:
-            ev = Event(self._prototype, self._by_name)
-            ev._is_bound = True
-            self._bound_copies[key] = ev
-            return ev
+            pass
+        try:
+            # Drop the entry when the instance dies, before its id can be
+            # reused.
+            instance_ref = weakref(
+                instance, lambda _, key=key: self._bound_copies.pop(key, None)
+            )
+        except TypeError:
+            # Keeping the instance alive instead would leak every instance.
+            raise TypeError(
+                "Cannot bind event %r to %s instance without __dict__ and "
+                "__weakref__; add '__weakref__' to __slots__"
+                % (self._name, type(instance).__name__)
+            ) from None
+        ev = self._bound_copy()
+        self._bound_copies[key] = (instance_ref, ev)
+        return ev
+
+    def __copy__(self):
+        """Copies the event *without* its listeners.
+
+        This also applies to events of deep-copied owner instances:
+        subscriptions are not carried over to the copy.
+        """
+        # Takes over the already-inspected signature info and wrapper
+        # attributes, instead of running __init__ again.
+        cls = type(self)
+        ev = cls.__new__(cls)
+        ev.__dict__.update(self.__dict__)
+        ev._listeners = ()
+        ev._bound_copies = {}
+        return ev
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def _bound_copy(self):
+        ev = self.__copy__()
+        ev._is_bound = True
+        return ev
 
     def __call__(self, *args, **kwargs):
-        results = []
-        if self._prototype:
+        prototype = self._prototype
+        if not prototype:
+            # untyped event: nothing to check or normalize
+            return _dispatch(self._listeners, args, kwargs)
+        result, source = _UNSET, None
+        if self._prototype_empty:
+            if self.validate_args:
+                # Checks args/kwargs against specificed signature.
+                # Returns None, no need to look at the result.
+                if self._self_arg:
+                    prototype(None, *args, **kwargs)
+                else:
+                    prototype(*args, **kwargs)
+        else:
             # Checks args/kwargs against specificed signature
             # If the self arg is there, supply it.
             if self._self_arg:
-                r = self._prototype(None, *args, **kwargs)
+                r = prototype(None, *args, **kwargs)
             else:
-                r = self._prototype(*args, **kwargs)
+                r = prototype(*args, **kwargs)
             if r is not None:
-                results.append((r, self._prototype))
-            # Hide internal call semantics (by-position or by-name) from called
-            # listeners, by normalizing to the specified behavior.
-            if self._by_name:
-                # convert args to kwargs
-                kwargs1 = {name: val for name, val in zip(self._argnames, args)}
-                kwargs = kwargs.copy()
-                kwargs.update(kwargs1)
-                args = []
-            else:
-                # convert kwargs to args
-                args = list(args)
-                for name in self._argnames[len(args) :]:
-                    args.append(kwargs[name])
-                kwargs = {}
-        # === Call each listener ===
-        for listener in self._listeners:
-            try:
-                r = listener(*args, **kwargs)
-                if r is not None:
-                    results.append((r, listener))
-            except CancelEvent:
-                break
-        if len(results) > 1:
-            raise ValueError("Got more than one event result: %r" % (results,))
-        elif len(results) == 1:
-            return results[0][0]
-        else:
-            return None
+                result, source = r, prototype
+        # Snapshot: (un)subscribing replaces the tuple, it never changes
+        # the one being iterated.
+        listeners = self._listeners
+        if listeners:
+            # Hide internal call semantics (by-position or by-name) from
+            # called listeners, by normalizing to the specified behavior.
+            args, kwargs = self._normalize(args, kwargs)
+        return _dispatch(listeners, args, kwargs, result, source)
 
     # TODO: Signature of listener
     def __iadd__(self, listener) -> Self:
         if self._listeners is None:
             raise TypeError("Cannot add listener to unbound event")
-        self._listeners.append(listener)
+        if inspect.ismethod(listener):
+            try:
+                listener = WeakMethod(listener, self._remove_dead)
+            except TypeError:
+                # owner does not support weakrefs, keep strong reference
+                pass
+        self._listeners += (listener,)
         return self
 
     def __isub__(self, listener) -> Self:
         if self._listeners is None:
             raise TypeError("Cannot remove listener from unbound event")
-        self._listeners.remove(listener)
+        listeners = list(self._listeners)
+        for idx, item in enumerate(listeners):
+            if type(item) is WeakMethod:
+                item = item()
+            if item == listener:
+                del listeners[idx]
+                break
+        else:
+            raise ValueError("Listener is not subscribed: %r" % (listener,))
+        self._listeners = tuple(listeners)
         return self
 
+    def _remove_dead(self, ref):
+        # Callback of weakly referenced listeners
+        self._listeners = tuple(l for l in self._listeners if l is not ref)
+
     def __str__(self):
         if not self._prototype:
             return "<Event>"
@@ -252,17 +406,50 @@ class Event:
     __repr__ = __str__
 
 
+def _dispatch(listeners, args, kwargs, result=_UNSET, source=None):
+    """Calls each of ``listeners`` with the given arguments.
+
+    Returns the single non-None result (``result`` from ``source``, if
+    given, counts as one), or None.
+    """
+    for listener in listeners:
+        if type(listener) is WeakMethod:
+            listener = listener()
+            if listener is None:
+                continue
+        try:
+            r = listener(*args, **kwargs)
+        except CancelEvent:
+            break
+        if r is not None:
+            if result is not _UNSET:
+                raise ValueError(
+                    "Got more than one event result: %r"
+                    % ([(result, source), (r, listener)],)
+                )
+            result, source = r, listener
+    return None if result is _UNSET else result
+
+
 # legacy alias
 EventSource = Event
 
 
-def event(prototype=None, by_name=True):
+def event(prototype=None, by_name=True, validate_args=None):
     """Decorator that turns a function or method into an `Event`.
 
     See `Event`. The decorated function is used as prototype; special constraints apply.
+
+    ``validate_args``, if given, sets `Event.validate_args` for this event
+    only (and its bound copies).
     """
     if not prototype:
         # when called as @decorator(...)
-        return lambda prototype: event(prototype=prototype, by_name=by_name)
-
-    return Event(prototype, by_name=by_name)
+        return lambda prototype: event(
+            prototype=prototype, by_name=by_name, validate_args=validate_args
+        )
+
+    ev = Event(prototype, by_name=by_name)
+    if validate_args is not None:
+        ev.validate_args = validate_args
+    return ev
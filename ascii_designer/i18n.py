@@ -18,7 +18,13 @@ except ImportError:
     resources = None
 import sys
 import os
+import functools
 import json
+try:
+    # faster parsing of large translation files
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 import ctypes
 import locale
 import logging
@@ -28,6 +34,9 @@ def L():
     return logging.getLogger(__name__)
 
 
+_MISSING = object()
+
+
 class Translations(dict):
     """Mostly off-the shelf python dict, except for some facilities to aid translation.
 
@@ -50,10 +59,11 @@ class Translations(dict):
     def get(self, key, default=None):
         if self.recording:
             return self.setdefault(key, default)
+        elif self.mark_missing:
+            value = dict.get(self, key, _MISSING)
+            return "$" + default if value is _MISSING else value
         else:
-            if self.mark_missing:
-                default = "$" + default
-            return super().get(key, default)
+            return dict.get(self, key, default)
 
     def get_prefix(self, prefix):
         """Returns a getter function like ``get`` that augments keys with
@@ -71,8 +81,9 @@ class Translations(dict):
         E.g. ``exc.ValueError``.
 
         The translated string MAY contain placeholders corresponding to
-        attributes of the exception object. Additionally, ``{exc}`` can be
-        used to insert the original string representation of the exception.
+        attributes of the exception object. Additionally, ``{exc}`` or
+        ``{str}`` can be used to insert the original string representation of
+        the exception. Placeholders for missing attributes are left empty.
 
         Fallback text is str(exc).
         """
@@ -80,7 +91,21 @@ class Translations(dict):
         if not text:
             return str(exc)
         else:
-            return text.format(str=str(exc), **exc.__dict__)
+            return text.format_map(_ExceptionFields(exc))
+
+
+class _ExceptionFields(dict):
+    """Placeholder values for `Translations.get_exception`, looked up
+    lazily."""
+
+    def __init__(self, exc):
+        super().__init__()
+        self.exc = exc
+
+    def __missing__(self, key):
+        if key in ("str", "exc"):
+            return str(self.exc)
+        return getattr(self.exc, key, "")
 
 def load_translations_json(package_or_dir="locale", prefix="", language=None):
     """Locate and load translations from JSON file.
@@ -116,7 +141,7 @@ def load_translations_json(package_or_dir="locale", prefix="", language=None):
     ):
         # filesystem path
         path = find_json_path(package_or_dir, prefix, language)
-        openfunc = lambda: path.open("r")
+        readfunc = lambda: path.read_text()
         type = "file"
     else:
         # resource dir
@@ -124,15 +149,20 @@ def load_translations_json(package_or_dir="locale", prefix="", language=None):
             L().error("importlib.resource is not available, translations must be loaded from file instead.")
             return Translations()
         path = find_resource(package_or_dir, prefix, language)
-        openfunc = lambda: resources.open_text(package_or_dir, path)
+        if hasattr(resources, "files"):
+            # Traversable API, Python 3.9+
+            readfunc = lambda: (
+                resources.files(package_or_dir).joinpath(path).read_text("utf-8")
+            )
+        else:
+            readfunc = lambda: resources.read_text(package_or_dir, path)
         type = "resource"
     # Not found
     if path is None:
         L().debug("No translations found")
         return Translations()
     L().debug("Load translations from %s %s", type, path)
-    with openfunc() as fp:
-        d = json.load(fp)
+    d = _json_loads(readfunc())
     return Translations(d)
 
 
@@ -147,6 +177,8 @@ def save_translations_json(translations, path):
     with path.open("w") as fp:
         json.dump(translations, fp, indent=2)
     L().info("Saved translations to %s", path)
+    # file might have been created
+    find_json_path.cache_clear()
     return path
 
 
@@ -154,6 +186,17 @@ def _join_ne(*strings):
     return ".".join(part for part in strings if part)
 
 
+@functools.lru_cache(maxsize=64)
+def _candidate_names(prefix, language):
+    """File names to look for, in order of preference."""
+    return (
+        _join_ne(prefix, language, "json"),
+        _join_ne(prefix, language[:2], "json"),
+        _join_ne(prefix or "default", "json"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def _os_locale():
     if sys.platform.startswith("linux"):
         lang = os.getenv("LANG")
@@ -168,6 +211,7 @@ def _os_locale():
         raise RuntimeError("Cannot guess language on %s platform" % sys.platform)
 
 
+@functools.lru_cache(maxsize=None)
 def find_json_path(dir, prefix="", language=None) -> Path:
     """Find location of translations file.
 
@@ -186,30 +230,48 @@ def find_json_path(dir, prefix="", language=None) -> Path:
     * then we look for emtpy language (i.e. default set).
 
     If none of these exists, None is returned.
+
+    Results are cached; call ``find_json_path.cache_clear()`` if files were
+    added or removed in the meantime.
     """
     dir = Path(dir)
     if language is None:
         language = _os_locale()
         L().debug("OS language: %s", language)
-    for name in [
-        _join_ne(prefix, language, "json"),
-        _join_ne(prefix, language[:2], "json"),
-        _join_ne(prefix or "default", "json"),
-    ]:
-        if (dir / name).exists():
+    candidates = _candidate_names(prefix, language)
+    # One directory listing instead of probing each name
+    try:
+        with os.scandir(dir) as entries:
+            present = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except PermissionError:
+        # not listable, but files might still be accessible
+        for name in candidates:
+            if (dir / name).exists():
+                return dir / name
+        return None
+    present_folded = {name.casefold() for name in present}
+    for name in candidates:
+        if name in present:
+            return dir / name
+        # Different case: let the file system decide whether it matches.
+        if name.casefold() in present_folded and (dir / name).exists():
             return dir / name
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def find_resource(package, prefix="", language=None):
     if language is None:
         language = _os_locale()
         L().debug("OS language: %s", language)
-    for name in [
-        _join_ne(prefix, language, "json"),
-        _join_ne(prefix, language[:2], "json"),
-        _join_ne(prefix or "default", "json"),
-    ]:
-        if resources.is_resource(package, name):
+    if hasattr(resources, "files"):
+        root = resources.files(package)
+        is_resource = lambda name: root.joinpath(name).is_file()
+    else:
+        is_resource = lambda name: resources.is_resource(package, name)
+    for name in _candidate_names(prefix, language):
+        if is_resource(name):
             return name
     return None
@@ -16,13 +16,17 @@ The general concept for Lists is this:
 
 import logging
 from collections.abc import MutableSequence
+from operator import attrgetter, itemgetter
+from types import FunctionType
 import weakref
 from .event import event
 
 __all__ = [
     'ObsList',
     'retrieve',
+    'retriever',
     'store',
+    'storer',
     ]
 
 L = lambda: logging.getLogger(__name__)
@@ -66,6 +70,62 @@ def retrieve(obj, source):
     else:
         raise ValueError('Could not evaluate source: %r'%source)
 
+def retriever(source):
+    '''Returns a function ``fn(obj)`` doing the same as ``retrieve(obj, source)``.
+
+    The kind of ``source`` is resolved only once, which pays off when
+    retrieving from many objects, e.g. for rendering or sorting a column.
+    '''
+    if isinstance(source, tuple) and len(source) == 2:
+        return retriever(source[0])
+    elif isinstance(source, str):
+        if source == '':
+            return str
+        if '.' in source:
+            # attrgetter would follow the dotted path, getattr does not.
+            get_attr = lambda obj: getattr(obj, source)
+        else:
+            get_attr = attrgetter(source)
+        get_item = itemgetter(source)
+        # Types whose instances can never have the attribute, e.g. dict.
+        item_types = set()
+        def retrieve_attr_or_item(obj):
+            if type(obj) in item_types:
+                try:
+                    return get_item(obj)
+                except TypeError:
+                    # raise the AttributeError, as retrieve does
+                    return get_attr(obj)
+            try:
+                return get_attr(obj)
+            except AttributeError as e:
+                try:
+                    value = obj[source]
+                except TypeError:
+                    # raise original exception
+                    raise e
+                if _lacks_attribute(obj, source):
+                    item_types.add(type(obj))
+                return value
+        return retrieve_attr_or_item
+    elif isinstance(source, list) and len(source)==1:
+        return itemgetter(source[0])
+    elif callable(source):
+        return source
+    else:
+        raise ValueError('Could not evaluate source: %r'%source)
+
+def _lacks_attribute(obj, name):
+    '''True if no instance of ``type(obj)`` can have attribute ``name``.'''
+    cls = type(obj)
+    return (
+        not hasattr(obj, '__dict__')
+        and not hasattr(cls, name)
+        and not hasattr(cls, '__getattr__')
+        # builtin attribute lookup, i.e. not overridden in Python
+        and not isinstance(cls.__getattribute__, FunctionType)
+    )
+
 def store(obj, val, source):
     '''Automagic storing of object properties.
     
@@ -101,6 +161,41 @@ def store(obj, val, source):
     else:
         raise ValueError('Could not evaluate source: %r' % source)
 
+def storer(source):
+    '''Returns a function ``fn(obj, val)`` doing the same as
+    ``store(obj, val, source)``.
+
+    The kind of ``source`` is resolved only once. Worth it only if the
+    function is kept and reused; for a single call, use `store`.
+    '''
+    if isinstance(source, tuple) and len(source) == 2:
+        return storer(source[1])
+    elif isinstance(source, str):
+        if source == '':
+            raise ValueError('Empty string source cannot be used to store data.')
+        else:
+            return lambda obj, val: setattr(obj, source, val)
+    elif isinstance(source, list) and len(source) == 1:
+        key = source[0]
+        def store_item(obj, val):
+            obj[key] = val
+        return store_item
+    elif callable(source):
+        return source
+    else:
+        raise ValueError('Could not evaluate source: %r' % source)
+
+
+# Events of ObsList, shared between a tree's sublists
+_EVENT_NAMES = (
+    'on_insert',
+    'on_insert_many',
+    'on_replace',
+    'on_remove',
+    'on_load_children',
+    'on_sort',
+    'on_get_selection',
+)
     
 class ObsList(MutableSequence):
     '''
@@ -127,7 +222,12 @@ class ObsList(MutableSequence):
 
     .. note:: Events are defined with positional args for backwards-compat reasons.
 
+    Events are only triggered by ``ObsList`` itself, so their arguments are not
+    validated against the prototype. Without listeners, triggering is cheap.
+
     * ``on_insert(idx, item, toolkit_parent_id) -> toolkit_id``: function to call for each inserted item
+    * ``on_insert_many(idx, items, toolkit_parent_id) -> toolkit_ids``: items were appended by ``extend``.
+        If not handled, ``on_insert`` is called for each item instead.
     * ``on_replace(toolkit_id, item)``: function to call for replaced item
         Replacement of item implies that children are "collapsed" again.
     * ``on_remove(toolkit_id)``: function to call for each removed item
@@ -144,29 +244,42 @@ class ObsList(MutableSequence):
     ``on_sort``: Info argument is a dict containing custom info, e.g. column
     that was sorted by.
     '''
+    # __dict__ holds the bound events (and handlers assigned to them).
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        '_binding',
+        '_children_source',
+        '_has_children_source',
+        '_nodes',
+        '_childlists',
+        '_positions',
+        '_sort_info',
+        'toolkit_parent_id',
+        'toolkit_ids',
+    )
+
     def __init__(self, iterable=None, binding=None, toolkit_parent_id=None):
         # TODO: binding is only needed to forward .source(), and causes lots of
         # headache. How to get rid of it?
         self.binding = binding
         self._children_source = None
         self._has_children_source = None
-        if iterable:
-            self._nodes = [item for item in iterable]
-        else:
-            self._nodes = []
+        self._nodes = list(iterable) if iterable is not None else []
+        n = len(self._nodes)
         self.toolkit_parent_id = toolkit_parent_id
-        self.toolkit_ids = [None] * len(self._nodes)
+        self.toolkit_ids = [None] * n
         # If List is turned into a tree by setting children_source,
         # this is made into a list of child ObsList.
         # Initially all children are set to None, and will be loaded
         # lazily by explicit call to ``load_children``.
-        self._childlists = [None]*len(self._nodes)
-        def dummy_handler(*args, **kwargs):
-            return None
+        self._childlists = [None] * n
+        # id(item) -> index, built on demand by _index.
+        self._positions = None
         # key, reverse, info
         self._sort_info = (None, False, {})
 
-    @event(by_name=False)
+    @event(by_name=False, validate_args=False)
     def on_insert(self, idx:int, item, toolkit_parent_id):
         """Event: An item was inserted.
 
@@ -182,22 +295,31 @@ class ObsList(MutableSequence):
         (e.g string or QModelIndex).
         """
 
-    @event(by_name=False)
+    @event(by_name=False, validate_args=False)
+    def on_insert_many(self, idx:int, items:list, toolkit_parent_id):
+        """Event: Several items were inserted, starting at ``idx``.
+
+        The handler must return the list of "Toolkit IDs" of the inserted
+        items. If there is no handler, `.on_insert` is triggered for each
+        item instead.
+        """
+
+    @event(by_name=False, validate_args=False)
     def on_replace(self, toolkit_id, item):
         """Event: Item with the associated toolkit ID was replaced by the given one.
     
         Replacement of item implies that children are "collapsed" again.
         """
 
-    @event(by_name=False)
+    @event(by_name=False, validate_args=False)
     def on_remove(self, toolkit_id):
         """Event: item with the given toolkit_id was removed."""
 
-    @event(by_name=False)
+    @event(by_name=False, validate_args=False)
     def on_load_children(self, sublist:"ObsList"):
         """Event: children of a node were retrieved."""
 
-    @event(by_name=False)
+    @event(by_name=False, validate_args=False)
     def on_get_selection(self):
         """Event: .selection property is retrieved
 
@@ -209,7 +331,7 @@ class ObsList(MutableSequence):
         # FIXME: Code smell here. Instead of misusing the event mechanism, the
         # ListVariable should rather set a callback on the list object.
 
-    @event(by_name=False)
+    @event(by_name=False, validate_args=False)
     def on_sort(self, sublist:"ObsList", info: dict):
         """Indicates that the given ``sublist`` was sorted.
 
@@ -226,10 +348,7 @@ class ObsList(MutableSequence):
 
     @binding.setter
     def binding(self, val):
-        if val is None:
-            self._binding = lambda: None
-        else:
-            self._binding = weakref.ref(val)
+        self._binding = _do_nothing if val is None else weakref.ref(val)
     
         
     @property
@@ -268,16 +387,22 @@ class ObsList(MutableSequence):
         ``has_children`` is usually evaluated immediately, because the treeview 
         needs to decide whether to display an expander icon.
         '''
-        self._children_source = children_source
-        if not has_children_source:
-            has_children_source = (lambda obj: True)
-        self._has_children_source = has_children_source
-        self._childlists = [None] * len(self._nodes)
+        # Sources are stored resolved to retriever functions. Those can be
+        # passed in again, since the retriever of a callable is itself.
+        self._children_source = retriever(children_source) if children_source else None
+        # None: every item has children
+        self._has_children_source = (
+            retriever(has_children_source) if has_children_source else None
+        )
+        # Drop already-loaded children; keep the list if there are none.
+        if any(cl is not None for cl in self._childlists):
+            self._childlists = [None] * len(self._nodes)
 
     def has_children(self, item):
         if not self._children_source:
             return False
-        return retrieve(item, self._has_children_source)
+        has_children = self._has_children_source
+        return True if has_children is None else has_children(item)
 
     def load_children(self, idx_tuple):
         '''Retrieves the childlist of item at given idx.
@@ -287,24 +412,21 @@ class ObsList(MutableSequence):
             return
         lst, idx = self._list_idx(idx_tuple) 
         item = lst._nodes[idx]
-        childlist = retrieve(item, source)
+        childlist = source(item)
         childlist = ObsList(childlist, toolkit_parent_id=self.toolkit_ids[idx])
         # Child SHARES event handlers and child source
         childlist._children_source = self._children_source
         childlist._has_children_source = self._has_children_source
-        childlist.on_insert = self.on_insert
-        childlist.on_replace = self.on_replace
-        childlist.on_remove = self.on_remove
-        childlist.on_load_children = self.on_load_children
-        childlist.on_sort = self.on_sort
-        childlist.on_get_selection = self.on_get_selection
+        childlist.__dict__.update(
+            (name, getattr(self, name)) for name in _EVENT_NAMES
+        )
         lst._childlists[idx] = childlist
         lst.on_load_children(childlist)
 
     def get_children(self, idx_tuple):
         '''Get childlist of item at given idx, loading it if not already loaded.'''
         lst, idx = self._list_idx(idx_tuple)
-        if lst._childlists[idx_tuple] is None:
+        if lst._childlists[idx] is None:
             self.load_children(idx_tuple)
         return lst._childlists[idx]
 
@@ -314,24 +436,35 @@ class ObsList(MutableSequence):
         ``info`` is optional information to be passed on to on_sort.
 
         Set ``restore`` to reuse key and info from last ``sort`` call.
+
+        Only sorts this level; use ``sort_tree`` to include loaded children.
         '''
         if restore:
             key, reverse, info = self._sort_info
         self._sort_info = (key, reverse, info)
-        if key is None: 
-            key=lambda x: x
-        sl = [ 
-            (item, iid, childlist) 
-            for item, iid, childlist in zip(
-                self._nodes, self.toolkit_ids, self._childlists
-            )
-        ]
-        sl.sort(key=lambda t: key(t[0]), reverse=reverse)
-        self._nodes = [t[0] for t in sl]
-        self.toolkit_ids = [t[1] for t in sl]
-        self._childlists = [t[2] for t in sl]
+        nodes = self._nodes
+        keys = nodes if key is None else [key(item) for item in nodes]
+        # Sort positions instead of (item, iid, childlist) tuples
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        # (With less than two items, order is always unchanged.)
+        if order != list(range(len(order))):
+            self._positions = None
+            pick = itemgetter(*order)
+            self._nodes = list(pick(nodes))
+            self.toolkit_ids = list(pick(self.toolkit_ids))
+            self._childlists = list(pick(self._childlists))
         self.on_sort(self, info=info or {})
-        # FIXME: sort childlists as well?
+
+    def sort_tree(self, key=None, reverse=False, info=None):
+        '''Sort the list and all loaded childlists recursively.
+
+        Arguments are as for ``sort``. Childlists are sorted before their
+        parent list; ``on_sort`` fires once for each sorted list.
+        '''
+        for childlist in self._childlists:
+            if childlist is not None:
+                childlist.sort_tree(key, reverse, info)
+        self.sort(key, reverse, info)
 
     def find(self, item):
         '''Finds the sublist and index of the item.
@@ -370,32 +503,52 @@ class ObsList(MutableSequence):
         return self._find(item, True, True)
 
     def _find(self, needle, is_tkid, return_idx_tuple):
-        """Implementation of find."""
-        lst = self.toolkit_ids if is_tkid else self._nodes
-        try:
-            idx = lst.index(needle)
-            # if we got here, we found it
+        """Implementation of find.
+
+        Walks the tree depth-first with an explicit stack of
+        ``(sublist, idx_tuple)``, own items before children's.
+        """
+        stack = [(self, ())]
+        while stack:
+            lst, path = stack.pop()
+            try:
+                if is_tkid:
+                    idx = lst.toolkit_ids.index(needle)
+                else:
+                    idx = lst._index(needle)
+            except ValueError:
+                # Not in own items, search children (first child on top)
+                stack.extend(
+                    (childlist, path + (n,))
+                    for n, childlist in reversed(list(enumerate(lst._childlists)))
+                    if childlist is not None
+                )
+                continue
             if return_idx_tuple:
-                return (idx,)
+                return path + (idx,)
             else:
-                return self, idx
-        except ValueError:
-            # Not in own items, search children
-            for n, childlist in enumerate(self._childlists):
-                if childlist is None:
-                    continue
-                try:
-                    result = childlist._find(needle, is_tkid, return_idx_tuple)
-                except ValueError:
-                    continue
-                else:
-                    if return_idx_tuple:
-                        return (n,) + result
-                    else:
-                        return result
+                return lst, idx
         # not found
         raise ValueError(f'{"Toolkit ID " if is_tkid else "Item"} not in tree', needle)
 
+    def _index(self, item):
+        '''Index of ``item`` in own nodes.
+
+        Looks up by identity first, using a map that is kept until the list
+        changes; falls back to equality. Raises ValueError if not found.
+        '''
+        positions = self._positions
+        if positions is None:
+            nodes = self._nodes
+            # first occurrence wins
+            positions = self._positions = {
+                id(nodes[i]): i for i in reversed(range(len(nodes)))
+            }
+        try:
+            return positions[id(item)]
+        except KeyError:
+            return self._nodes.index(item)
+
     def _list_idx(self, idx_tuple):
         if isinstance(idx_tuple, tuple):
             lst = self
@@ -411,18 +564,38 @@ class ObsList(MutableSequence):
         
     def __len__(self):
         return len(self._nodes)
+
+    # Read-only protocol served by the underlying list, instead of the
+    # MutableSequence mixins going through __getitem__ item by item.
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __reversed__(self):
+        return reversed(self._nodes)
+
+    def __contains__(self, item):
+        return item in self._nodes
+
+    def index(self, item, start=0, stop=None):
+        nodes = self._nodes
+        return nodes.index(item, start, len(nodes) if stop is None else stop)
+
+    def count(self, item):
+        return self._nodes.count(item)
     
     def __setitem__(self, idx_tuple, item):
         lst, idx = self._list_idx(idx_tuple)
         lst._nodes[idx] = item
+        lst._positions = None
         # collapse
         lst._childlists[idx] = None
-        lst.sorted = False
         lst.on_replace(self.toolkit_ids[idx], item)
         
     def __delitem__(self, idx_tuple):
         lst, idx = self._list_idx(idx_tuple)
         del lst._nodes[idx]
+        lst._positions = None
         lst._childlists.pop(idx)
         tkid = lst.toolkit_ids.pop(idx)
         lst.on_remove(tkid)
@@ -436,18 +609,39 @@ class ObsList(MutableSequence):
         else:
             if idx > N: idx = N
         lst._nodes.insert(idx, item)
+        lst._positions = None
         # cannot use "truthy" value since list might be empty
         lst._childlists.insert(idx, None)
-        lst.sorted = False
         tkid = lst.on_insert(idx, item, self.toolkit_parent_id)
         lst.toolkit_ids.insert(idx, tkid)
         return idx, item
 
+    def extend(self, values):
+        '''Append all items from ``values``.
+
+        The list is extended in one go and `on_insert_many` is triggered once.
+        '''
+        items = list(values)
+        if not items:
+            return
+        start = len(self._nodes)
+        self._nodes.extend(items)
+        self._positions = None
+        self._childlists.extend([None] * len(items))
+        self.toolkit_ids.extend([None] * len(items))
+        tkids = self.on_insert_many(start, items, self.toolkit_parent_id)
+        if tkids is None:
+            # not handled
+            tkids = [
+                self.on_insert(idx, item, self.toolkit_parent_id)
+                for idx, item in enumerate(items, start)
+            ]
+        self.toolkit_ids[start:] = tkids
+
     def item_mutated(self, item):
         '''Call this when you mutated the item (which must be in this list)
         and want to update the GUI.
         '''
-        idx = self._nodes.index(item)
+        idx = self._index(item)
         # do NOT collapse
-        self.sorted = False
         self.on_replace(self.toolkit_ids[idx], item)
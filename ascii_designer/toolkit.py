@@ -234,9 +234,8 @@ class ToolkitBase:
         Translations work the same as for `.parse`.'''
         if translations is None:
             translations = {}
-        menudef = menudef[:]
-        while menudef:
-            item = menudef.pop(0)
+        items = iter(menudef)
+        for item in items:
             for name, regex, _ in self.menu_grammar:
                 m = re.match(regex, item)
                 if m:
@@ -247,8 +246,11 @@ class ToolkitBase:
                         d['text'] = translations.get(translation_prefix+d['id'], text)
                     L().debug('Menuentry %r --> %s %r', item, name, d)
                     if name == 'sub':
+                        subdef = next(items, None)
+                        if subdef is None:
+                            raise ValueError('Submenu %r must be followed by a list of entries'%(item,))
                         submenu = self.menu_sub(parent, **d)
-                        self.parse_menu(submenu, menudef.pop(0), handlers, translations, translation_prefix)
+                        self.parse_menu(submenu, subdef, handlers, translations, translation_prefix)
                     elif name == 'command':
                         if d['shortcut'] is None and d['id'] in self.default_shortcuts:
                             d['shortcut'] = self.default_shortcuts[d['id']]
@@ -381,6 +383,12 @@ class ListBinding:
         self._sources = {k:k for k in self.keys}
         # set text source always
         self._sources.setdefault('', '')
+        # column -> retriever function, kept in sync with _sources
+        self._retrievers = {
+            k: list_model.retriever(source) for k, source in self._sources.items()
+        }
+        # column -> storer function, filled on demand
+        self._storers = {}
         self.allow_sorting = True
         """Enable / disable sorting by clicking on a column header"""
 
@@ -415,6 +423,7 @@ class ListBinding:
         l = self._list
         if l is not None:
             l.on_insert -= self.on_insert
+            l.on_insert_many -= self.on_insert_many
             l.on_replace -= self.on_replace
             l.on_remove -= self.on_remove
             l.on_load_children -= self.on_load_children
@@ -434,6 +443,7 @@ class ListBinding:
         l = self._list = val
         if l is not None:
             l.on_insert += self.on_insert
+            l.on_insert_many += self.on_insert_many
             l.on_replace += self.on_replace
             l.on_remove += self.on_remove
             l.on_load_children += self.on_load_children
@@ -460,13 +470,29 @@ class ListBinding:
                 raise KeyError('No column "%s" exists'%key)
         if _text is not None:
             kwargs[''] = _text
+        self._retrievers.update(
+            (key, list_model.retriever(source)) for key, source in kwargs.items()
+        )
         self._sources.update(kwargs)
+        self._storers.clear()
     
     def retrieve(self, item, column=''):
-        return list_model.retrieve(item, self._sources[column])
+        return self._retrievers[column](item)
+
+    def retrieve_column(self, column='', items=None):
+        '''Returns the values of ``column`` for all ``items``, default: all
+        items of the (toplevel) list.'''
+        if items is None:
+            items = self._list
+        return list(map(self._retrievers[column], items))
 
     def store(self, item, val, column=''):
-        return list_model.store(item, val, self._sources[column])
+        try:
+            storer = self._storers[column]
+        except KeyError:
+            # resolved on first use, as the text column usually can't store
+            storer = self._storers[column] = list_model.storer(self._sources[column])
+        return storer(item, val)
 
     def sort(self, key=None, ascending:bool=None, restore=False):
         '''Sort the list using one of the columns.
@@ -487,7 +513,7 @@ class ListBinding:
             key = self.sort_key
             ascending = self.sort_ascending
         if isinstance(key, str):
-            keyfunc = lambda item: self.retrieve(item, key)
+            keyfunc = self._retrievers[key]
             info = {
                 'sort_ascending': ascending,
                 'sort_key': key,
@@ -505,6 +531,14 @@ class ListBinding:
 
     def on_insert(self, idx, item, toolkit_parent_id):
         '''ABSTRACT: Insert item in tree, return toolkit_id'''
+    def on_insert_many(self, idx, items, toolkit_parent_id):
+        '''Insert several items in tree, return list of toolkit_ids.
+
+        Base implementation returns None, i.e. not handled: the list then
+        triggers ``on_insert`` for each item. Override if the GUI can insert
+        items in bulk; ``on_insert`` is not triggered for them in that case.
+        '''
+        return None
     def on_replace(self, iid, item):
         '''ABSTRACT: update GUI with changed item'''
     def on_remove(self, iid):
@@ -538,6 +538,10 @@ class ListBindingQt(QAbstractItemModel, ListBinding):
     def on_insert(self, idx, item, toolkit_parent_id):
         self.layoutChanged.emit()
 
+    def on_insert_many(self, idx, items, toolkit_parent_id):
+        self.layoutChanged.emit()
+        return [None] * len(items)
+
     def on_load_children(self, children):
         self.layoutChanged.emit()
 
@@ -0,0 +1,73 @@
+import pytest
+import textwrap
+from ascii_designer.ascii_slice import (
+    slice_grid, merged_cells, MCell, _overlapping_merge, _adj_row_merge,
+    _dedented_lines,
+)
+
+@pytest.mark.parametrize('text', [
+    '',
+    'abc',
+    '    abc\n      def\n',
+    '\n    abc\n        \n      def\n  \n',
+    '  abc\n\tdef',
+    # not indentation for textwrap.dedent
+    '  \u3000abc\n  def\n  \u3000\n',
+    _adj_row_merge,
+])
+def test_dedented_lines(text):
+    lines = _dedented_lines(text)
+    if text.endswith(' '):
+        assert lines.pop() == ''
+    assert lines == textwrap.dedent(text).splitlines()
+
+def test_slice_grid():
+    g = slice_grid('''
+        |  |   |
+         ab cde
+         f
+    ''')
+    assert g.column_heads == ['  ', '   ', '']
+    assert g.body_lines == [[' ab', ' cde', ' '], [' f ', '    ', ' ']]
+
+def test_slice_grid_empty():
+    g = slice_grid('  \n   \n')
+    assert g.column_heads == []
+    assert g.body_lines == []
+
+def test_merged_cells_colspan():
+    g = slice_grid('''
+        |   |   |   |
+         abc defghi
+    ''')
+    cells = list(merged_cells(g))
+    assert cells[0] == MCell(row=0, col=0, text='abc', rowspan=1, colspan=1)
+    assert cells[1] == MCell(row=0, col=1, text='defghi ', rowspan=1, colspan=2)
+
+def test_merged_cells_rowspan():
+    g = slice_grid(_adj_row_merge)
+    before = [cells[:] for cells in g.body_lines]
+    cells = list(merged_cells(g))
+    # input grid is left untouched
+    assert g.body_lines == before
+    assert cells[0] == MCell(row=0, col=0, text='abc\ndef', rowspan=2, colspan=1)
+    assert cells[3] == MCell(row=2, col=0, text='ghi   \njkl   ', rowspan=2, colspan=2)
+    assert cells[4] == MCell(row=4, col=0, text='mno\npqr', rowspan=2, colspan=1)
+
+def test_merged_cells_overlap():
+    with pytest.raises(ValueError):
+        list(merged_cells(slice_grid(_overlapping_merge)))
+
+@pytest.mark.parametrize('text', [_adj_row_merge, '''
+    |   |   |   |
+     abc     defghi
+      {x  {  
+      {   {y 
+    ''',
+    # blank area spanning columns: a tab is not a separator
+    '|   |   |   |\n    \t    [ OK ]',
+])
+def test_merged_cells_skip_empty(text):
+    g = slice_grid(text)
+    expected = [c for c in merged_cells(g) if c.text.strip()]
+    assert list(merged_cells(g, skip_empty=True)) == expected
@@ -0,0 +1,175 @@
+import pytest
+from ascii_designer.autoframe import AutoFrame, _convert_title
+from ascii_designer.toolkit import ToolkitBase
+
+@pytest.mark.parametrize('classname,title', [
+    ('Main', 'Main'),
+    ('TextTransformer', 'Text Transformer'),
+    ('FlightBooker2', 'Flight Booker 2'),
+    ('CRUD', 'C R U D'),
+    ('lowercase', 'lowercase'),
+    ('MyÄrger', 'My Ärger'),
+    ('FormÉdit', 'Form Édit'),
+])
+def test_convert_title(classname, title):
+    assert _convert_title(classname) == title
+
+
+class FakeWidget:
+    def __init__(self, kind, id):
+        self.kind = kind
+        self.id = id
+        self.value = None
+        self.handler = None
+
+class FakeToolkit(ToolkitBase):
+    '''Toolkit creating FakeWidget's, recording placement.'''
+    def __init__(self):
+        super().__init__()
+        self.placed = {}
+    def root(self, title='Window', icon='', on_close=None):
+        return FakeWidget('root', '')
+    def place(self, widget, row=0, col=0, rowspan=1, colspan=1):
+        self.placed[widget.id] = (row, col, rowspan, colspan)
+    def anchor(self, widget, left=True, right=True, top=True, bottom=True):
+        widget.anchor = (left, right)
+    def connect(self, widget, function):
+        widget.handler = function
+    def getval(self, widget):
+        return widget.value
+    def setval(self, widget, value):
+        widget.value = value
+
+for _name in 'box label button textbox multiline treelist dropdown combo option checkbox slider'.split():
+    setattr(FakeToolkit, _name, lambda self, parent, _name=_name, **kwargs: FakeWidget(_name, kwargs['id']))
+
+
+@pytest.fixture
+def fake_toolkit(monkeypatch):
+    monkeypatch.setattr('ascii_designer.autoframe.get_toolkit', FakeToolkit)
+
+
+class Form(AutoFrame):
+    f_body = '''
+        |              |          |
+         Name:          [ name_  ]
+         [ OK ]         [Cancel]
+    '''
+    def ok(self):
+        return 'ok'
+
+    def on_cancel(self):
+        return 'cancel'
+
+    # not callable: must not be bound
+    name = 'Name'
+
+
+def test_build_and_autowire(fake_toolkit):
+    f = Form()
+    root = f.f_controls[''] = f.f_toolkit.root()
+    f.f_build(root)
+    assert f.f_toolkit.placed == {
+        'label_name': (0, 0, 1, 1),
+        'name': (0, 1, 1, 1),
+        'ok': (1, 0, 1, 1),
+        'cancel': (1, 1, 1, 1),
+    }
+    assert f['label_name'].anchor == (True, False)
+    assert f['name'].anchor == (True, True)
+    assert f['ok'].anchor == (True, False)
+    assert f['ok'].handler() == 'ok'
+    assert f['cancel'].handler() == 'cancel'
+    assert f['name'].handler is None
+    assert f['label_name'].handler is None
+
+
+def test_virtual_attributes(fake_toolkit):
+    class Form2(AutoFrame):
+        f_body = '''
+            |         |
+             [ text_ ]
+        '''
+    f = Form2()
+    assert f.f_title == 'Form 2'
+    f.f_build(f.f_toolkit.root())
+    f.text = 'abc'
+    assert f['text'].value == 'abc'
+    assert f.text == 'abc'
+    f.other = 1
+    assert f.__dict__['other'] == 1
+    with pytest.raises(AttributeError):
+        f.missing
+
+
+def test_prewarm():
+    from ascii_designer import prewarm
+    from ascii_designer.ascii_slice import slice_grid
+    class Form3(AutoFrame):
+        f_body = '''
+            |  |
+             a
+        '''
+        f_body_extra = '''
+            |  |
+             b
+        '''
+    hits = slice_grid.cache_info().hits
+    prewarm(Form3)
+    slice_grid(Form3.f_body)
+    slice_grid(Form3.f_body_extra)
+    assert slice_grid.cache_info().hits == hits + 2
+
+
+def test_missing_super_init(fake_toolkit):
+    class Form4(AutoFrame):
+        def __init__(self):
+            self.x = 1
+    with pytest.raises(RuntimeError):
+        Form4()
+
+
+def test_autowire_instance_attribute(fake_toolkit):
+    f = Form()
+    # instance attributes take precedence over class members
+    f.__dict__['on_name'] = lambda: 'instance'
+    f.__dict__['ok'] = 'not callable'
+    f.f_build(f.f_toolkit.root())
+    assert f['name'].handler() == 'instance'
+    assert f['ok'].handler is None
+    assert f['cancel'].handler() == 'cancel'
+
+
+def test_autowire_shadowed_member(fake_toolkit):
+    class SubForm(Form):
+        # shadows the callable Form.ok
+        ok = None
+        def on_ok(self):
+            return 'on_ok'
+    f = SubForm()
+    f.f_build(f.f_toolkit.root())
+    assert f['ok'].handler() == 'on_ok'
+
+
+def test_multiple_inheritance(fake_toolkit):
+    class Mixin:
+        __slots__ = ('x',)
+
+    class Form5(AutoFrame, Mixin):
+        pass
+
+    class Form6(AutoFrame, Exception):
+        pass
+
+    assert Form5().f_controls == {}
+    assert Form6().f_controls == {}
+
+
+def test_add_widgets_plain_autoframe(fake_toolkit):
+    from types import SimpleNamespace
+    f = Form()
+    target = SimpleNamespace(ok=lambda: 'ns')
+    f.f_add_widgets(f.f_toolkit.root(), body=Form.f_body, autoframe=target)
+    assert f['ok'].handler() == 'ns'
+    assert f['cancel'].handler is None
+    assert not hasattr(SimpleNamespace, '_f_handler_names')
@@ -1,3 +1,4 @@
+import gc
 import pytest
 import inspect
 from unittest.mock import Mock
@@ -226,6 +227,28 @@ def test_event_copy_instance(Cls):
     m1.assert_called_once_with(a=2)
 
 
+def test_event_deepcopy_owner(Cls):
+    """deep copies of the owner get the event without listeners"""
+    import copy
+
+    class Listener:
+        def on_ev1(self, a):
+            calls.append(a)
+
+    calls = []
+    listener = Listener()
+    o1 = Cls()
+    o1.ev1 += listener.on_ev1
+    o2 = copy.deepcopy(o1)
+    assert o2.ev1._listeners == ()
+    o2.ev1(2)
+    ev = copy.copy(o1.ev1)
+    assert ev._listeners == ()
+    ev(3)
+    o1.ev1(1)
+    assert calls == [1]
+
+
 def test_class_self_handling(Cls):
     """self argument CAN be there but is ignored."""
     o = Cls()
@@ -246,3 +269,172 @@ def test_class_call_with_self(Cls):
     o = Cls()
     Cls.ev2(o, 3)
     # XXX WHat do we expect here!?
+
+
+def test_event_no_validation(ev2, monkeypatch):
+    """With validate_args off, the prototype is not executed."""
+    ev2 += (m := Mock())
+    monkeypatch.setattr(Event, "validate_args", False)
+    ev2(1, b=2)
+    m.assert_called_once_with(a=1, b=2)
+
+
+def test_bound_event_stored_on_instance(Cls):
+    """Bound copy is created once and then found in the instance dict."""
+    o = Cls()
+    ev = o.ev1
+    assert o.__dict__["ev1"] is ev
+    assert o.ev1 is ev
+
+
+def test_bound_event_reuses_signature(Cls, monkeypatch):
+    """Bound copies do not inspect the prototype again."""
+    unbound = Cls.ev2
+    monkeypatch.setattr(inspect, "signature", Mock(side_effect=AssertionError))
+    o = Cls()
+    bound = o.ev2
+    assert bound._argnames == unbound._argnames == ("a",)
+    assert bound.__doc__ == unbound.__doc__
+    assert bound._listeners == ()
+    assert str(bound) == str(unbound).replace("Unbound", "Bound")
+
+
+def test_bound_event_slots():
+    """Bound copies also work for instances without __dict__"""
+
+    class Slotted:
+        __slots__ = ("__weakref__",)
+
+        @event
+        def ev(self, a):
+            pass
+
+    o1, o2 = Slotted(), Slotted()
+    assert o1.ev is o1.ev
+    assert o1.ev is not o2.ev
+    # Bound copy lives as long as the instance
+    ev = o1.ev
+    ev += print
+    del ev
+    gc.collect()
+    assert o1.ev._listeners == (print,)
+    # entries go away with their owner
+    del o1
+    gc.collect()
+    assert len(Slotted.ev._bound_copies) == 1
+
+
+def test_bound_event_slots_no_weakref():
+    class Slotted:
+        __slots__ = ()
+
+        @event
+        def ev(self, a):
+            pass
+
+    with pytest.raises(TypeError):
+        Slotted().ev
+    assert Slotted.ev._bound_copies == {}
+
+
+def test_unsubscribe_during_dispatch(ev1):
+    """Listeners (un)subscribing while the event is processed do not affect
+    the running dispatch."""
+    m2 = Mock(return_value=None)
+    m3 = Mock(return_value=None)
+
+    def l1():
+        nonlocal ev1
+        ev1 -= l1
+        ev1 += m3
+
+    ev1 += l1
+    ev1 += m2
+    ev1()
+    m2.assert_called_once_with()
+    m3.assert_not_called()
+    ev1()
+    assert m2.call_count == 2
+    m3.assert_called_once_with()
+
+
+def test_event_prototype_with_code(monkeypatch):
+    """A prototype with actual code runs even if validation is off."""
+    @event
+    def ev(a):
+        return a * 2
+
+    @event
+    def ev_doc(a):
+        """Docstring only"""
+
+    assert not ev._prototype_empty
+    assert ev_doc._prototype_empty
+    monkeypatch.setattr(Event, "validate_args", False)
+    assert ev(a=21) == 42
+    assert ev_doc(a=21) is None
+
+
+def test_bound_method_listener_weakref(ev1):
+    """Bound method listeners do not keep their object alive."""
+    calls = []
+
+    class Listener:
+        def on_ev1(self):
+            calls.append(self)
+
+    listener = Listener()
+    ev1 += listener.on_ev1
+    ev1()
+    assert calls == [listener]
+    # unsubscribe with a fresh bound method object
+    ev1 -= listener.on_ev1
+    assert ev1._listeners == ()
+
+    ev1 += listener.on_ev1
+    calls.clear()
+    del listener
+    gc.collect()
+    assert ev1._listeners == ()
+    ev1()
+    assert calls == []
+    with pytest.raises(ValueError):
+        ev1 -= Listener().on_ev1
+
+
+def test_event_result(ev1):
+    ev1 += lambda: None
+    assert ev1() is None
+    ev1 += lambda: 1
+    assert ev1() == 1
+    m = Mock(return_value=None)
+    ev1 += lambda: 2
+    ev1 += m
+    with pytest.raises(ValueError):
+        ev1()
+    # raised at the second result
+    m.assert_not_called()
+
+
+def test_event_untyped():
+    ev = Event()
+    assert type(ev) is Event
+    m = Mock(return_value=None)
+    ev += m
+    assert ev(1, b=2) is None
+    m.assert_called_once_with(1, b=2)
+    ev += lambda *args, **kwargs: 3
+    assert ev() == 3
+    assert str(ev) == "<Event>"
+
+
+def test_event_decorator_validate_args(Cls):
+    @event(validate_args=False)
+    def ev(a):
+        pass
+
+    ev(b=1)
+    assert Event.validate_args
+    Cls.ev3 = ev
+    Cls.ev3.__set_name__(Cls, "ev3")
+    assert not Cls().ev3.validate_args
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from ascii_designer.i18n import (
+    Translations,
+    find_json_path,
+    load_translations_json,
+    save_translations_json,
+)
+
+
+def test_find_json_path(tmp_path):
+    find_json_path.cache_clear()
+    assert find_json_path(tmp_path, "app", "de_DE") is None
+    save_translations_json(Translations(a="b"), tmp_path / "app.de.json")
+    # cache was invalidated by saving
+    assert find_json_path(tmp_path, "app", "de_DE") == tmp_path / "app.de.json"
+    assert load_translations_json(tmp_path, "app", "de_DE") == {"a": "b"}
+    assert find_json_path(tmp_path / "missing", "app", "de_DE") is None
+
+
+def test_find_json_path_case(tmp_path):
+    find_json_path.cache_clear()
+    (tmp_path / "DE.json").write_text("{}")
+    # matches like Path.exists, i.e. depending on the file system
+    expected = tmp_path / "de.json" if (tmp_path / "de.json").exists() else None
+    assert find_json_path(tmp_path, "", "de") == expected
+
+
+def test_translations_get():
+    import copy
+    import pickle
+
+    tr = Translations(a="A")
+    assert tr.get("a", "x") == "A"
+    assert tr.get("b", "x") == "x"
+    tr.mark_missing = True
+    assert tr.get("a", "x") == "A"
+    assert tr.get("b", "x") == "$x"
+    tr.recording = True
+    assert tr.get("b", "x") == "x"
+    assert tr == {"a": "A", "b": "x"}
+    tr.recording = False
+    tr.mark_missing = False
+    assert tr.get("c", "x") == "x"
+    assert tr.get_prefix("b")("", "y") == "x"
+
+    for tr2 in (copy.copy(tr), pickle.loads(pickle.dumps(tr))):
+        tr2["c"] = "C"
+        assert tr2.get("c") == "C"
+        assert tr.get("c") is None
+
+
+def test_get_exception():
+    tr = Translations({"exc.KeyError": "Missing: {str} {foo}"})
+    assert tr.get_exception(ValueError("bad")) == "bad"
+    assert tr.get_exception(KeyError("x")) == "Missing: 'x' "
+    exc = KeyError("x")
+    exc.foo = "bar"
+    assert tr.get_exception(exc) == "Missing: 'x' bar"
+
+
+def test_load_resource():
+    tr = load_translations_json("test_ascii_designer_i18n", "", "de_DE")
+    assert tr
+    path = Path(__file__).parent.parent / "test_ascii_designer_i18n"
+    assert tr == load_translations_json(path, "", "de")
+
+
+def test_translations_get_flags_and_override(monkeypatch):
+    tr = Translations(a="A")
+    # flags are declared on the class and may be set there
+    monkeypatch.setattr(Translations, "mark_missing", True)
+    assert tr.get("b", "B") == "$B"
+    monkeypatch.undo()
+
+    class MyTranslations(Translations):
+        def get(self, key, default=None):
+            return "my"
+
+    assert MyTranslations(a="A").get("a") == "my"
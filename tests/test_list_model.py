@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, call
-from ascii_designer.list_model import ObsList
+from ascii_designer.list_model import ObsList, retrieve, retriever, store, storer
+from ascii_designer.toolkit import ListBinding
 
 def test_obslist_callbacks():
     m = Mock()
@@ -29,4 +30,231 @@ def test_obslist_callbacks():
     assert n.toolkit_ids[1] == 'two'
     n[0] = x2
     m.on_replace.assert_called_with('one', x2)
-    
\ No newline at end of file
+    
+
+class _Item:
+    name = 'attr'
+
+    def __str__(self):
+        return 'item'
+
+
+@pytest.mark.parametrize('obj, source, expected', [
+    (_Item(), '', 'item'),
+    (_Item(), 'name', 'attr'),
+    ({'name': 'key'}, 'name', 'key'),
+    ({'name': 'key'}, ['name'], 'key'),
+    (_Item(), ('name', 'setter'), 'attr'),
+    (_Item(), lambda obj: 42, 42),
+])
+def test_retriever(obj, source, expected):
+    assert retrieve(obj, source) == expected
+    assert retriever(source)(obj) == expected
+
+
+def test_retriever_errors():
+    get_name = retriever('name')
+    # same error on repeated calls
+    for _ in range(2):
+        with pytest.raises(AttributeError):
+            get_name(1)
+    with pytest.raises(ValueError):
+        retriever(1)
+    # no dotted paths
+    obj = _Item()
+    obj.b = _Item()
+    with pytest.raises(AttributeError):
+        retrieve(obj, 'b.name')
+    with pytest.raises(AttributeError):
+        retriever('b.name')(obj)
+
+
+def test_binding_sources_sort():
+    binding = ListBinding(keys=['name', 'rank'])
+    binding.list = [{'name': 'b', 'rank': 1}, {'name': 'a', 'rank': 2}]
+    assert binding.retrieve(binding.list[0], 'name') == 'b'
+    binding.sort('name', ascending=True)
+    assert [item['name'] for item in binding.list] == ['a', 'b']
+    binding.sources(name=lambda item: -item['rank'])
+    assert binding.retrieve(binding.list[0], 'name') == -2
+    binding.sort('name', ascending=True)
+    assert [item['rank'] for item in binding.list] == [2, 1]
+    assert binding.retrieve_column('rank') == [2, 1]
+    assert binding.retrieve_column('name', [{'rank': 5}]) == [-5]
+
+
+def test_obslist_sort():
+    m = Mock(return_value=None)
+    n = ObsList([3, 1, 2, 1])
+    n.toolkit_ids[:] = ['a', 'b', 'c', 'd']
+    n.on_sort += m
+    n.sort()
+    assert list(n) == [1, 1, 2, 3]
+    assert n.toolkit_ids == ['b', 'd', 'c', 'a']
+    m.assert_called_once_with(n, {})
+    n.sort(key=lambda x: -x, reverse=True, info={'x': 1})
+    # stable
+    assert n.toolkit_ids == ['b', 'd', 'c', 'a']
+    n.sort(key=lambda x: x % 2)
+    assert n.toolkit_ids == ['c', 'b', 'd', 'a']
+    n.sort(restore=True)
+    assert n.toolkit_ids == ['c', 'b', 'd', 'a']
+    assert m.call_count == 4
+
+
+def test_obslist_sort_tree():
+    m = Mock(return_value=None)
+    n = ObsList([[3, 1], [2], [5, 4]])
+    n.children_source(lambda x: x if isinstance(x, list) else [])
+    n.load_children(0)
+    n.load_children(2)
+    n.on_sort += m
+    n.sort_tree(key=lambda x: x[0] if isinstance(x, list) else x)
+    # childlists move along with their items
+    assert list(n) == [[2], [3, 1], [5, 4]]
+    assert n._childlists[0] is None
+    assert list(n[1, None]) == [1, 3]
+    assert list(n[2, None]) == [4, 5]
+    assert m.call_count == 3
+    assert m.call_args[0][0] is n
+
+
+def test_obslist_find_identity():
+    a1, a2, b = {'name': 'a'}, {'name': 'a'}, {'name': 'b'}
+    n = ObsList([a1, a2])
+    n.toolkit_ids[:] = ['a1', 'a2']
+    m = Mock()
+    n.on_replace += m.on_replace
+    n.item_mutated(a2)
+    m.on_replace.assert_called_once_with('a2', a2)
+    assert n.find(a2) == (n, 1)
+    # equal but distinct
+    assert n.find({'name': 'a'}) == (n, 0)
+    n.insert(0, b)
+    assert n.find2(a2) == (2,)
+    del n[0]
+    assert n.find(a2) == (n, 1)
+    with pytest.raises(ValueError):
+        n.find(b)
+
+
+def test_obslist_extend():
+    m = Mock()
+    n = ObsList([1])
+    n.on_insert += lambda idx, item, parent: 'id%d' % item
+    n.extend([2, 3])
+    assert list(n) == [1, 2, 3]
+    assert n.toolkit_ids == [None, 'id2', 'id3']
+
+    n.on_insert_many += m.on_insert_many
+    m.on_insert_many.return_value = ['x', 'y']
+    n += [4, 5]
+    m.on_insert_many.assert_called_once_with(3, [4, 5], None)
+    assert n.toolkit_ids == [None, 'id2', 'id3', 'x', 'y']
+    assert n._childlists == [None] * 5
+
+
+def test_obslist_extend_with_binding():
+    binding = ListBinding(keys=['name'])
+    binding.list = [1]
+    lst = binding.list
+    seen = []
+    lst.on_insert += lambda idx, item, parent: seen.append(item)
+    lst.extend([2, 3])
+    lst += [4]
+    assert seen == [2, 3, 4]
+    assert list(lst) == [1, 2, 3, 4]
+
+
+def test_obslist_tree():
+    n = ObsList([{'name': 'a', 'children': [1, 2]}, {'name': 'b', 'children': []}])
+    assert not n.has_children(n[0])
+    n.children_source('children', ['children'])
+    assert n.has_children(n[0])
+    assert not n.has_children(n[1])
+    n.load_children(0)
+    assert list(n[0, None]) == [1, 2]
+    assert n[0, 1] == 2
+    # resolved sources can be passed on
+    n2 = ObsList(n)
+    n2.children_source(n._children_source, n._has_children_source)
+    n2.load_children(0)
+    assert list(n2[0, None]) == [1, 2]
+    n2.children_source('children')
+    assert n2._childlists == [None, None]
+    assert n2.has_children(n2[1])
+    assert list(n2.get_children((0,))) == [1, 2]
+
+
+def test_obslist_find_tree():
+    n = ObsList([{'c': [1, 2]}, {'c': [3, [4]]}])
+    n.children_source(['c'])
+    n.load_children(0)
+    n.load_children(1)
+    assert n[0, None].on_insert is n.on_insert
+    assert n[0, None].on_get_selection is n.on_get_selection
+    n[1, None].children_source(lambda x: x if isinstance(x, list) else [])
+    n[1, None].load_children(1)
+    n[1, None].toolkit_ids[1] = 'tk'
+    assert n.find2(2) == (0, 1)
+    assert n.find2(3) == (1, 0)
+    assert n.find2(4) == (1, 1, 0)
+    assert n.find(4) == (n[1, None][1, None], 0)
+    assert n.find_by_toolkit_id2('tk') == (1, 1)
+    with pytest.raises(ValueError):
+        n.find(5)
+
+
+def test_retriever_attr_or_item():
+    class Row(dict):
+        pass
+
+    get = retriever('name')
+    assert get({'name': 1}) == 1
+    # second call takes the item shortcut for dict
+    assert get({'name': 2}) == 2
+    with pytest.raises(KeyError):
+        get({})
+    row = Row(name=3)
+    assert get(row) == 3
+    row.name = 4
+    assert get(row) == 4
+
+
+def test_obslist_sequence_protocol():
+    n = ObsList([1, 2, 3, 2])
+    assert list(n) == [1, 2, 3, 2]
+    assert list(reversed(n)) == [2, 3, 2, 1]
+    assert 3 in n and 4 not in n
+    assert n.index(2) == 1
+    assert n.index(2, 2) == 3
+    assert n.index(2, 0, None) == 1
+    with pytest.raises(ValueError):
+        n.index(2, 2, 3)
+    assert n.count(2) == 2
+
+
+def test_store():
+    item = _Item()
+    d = {}
+    for obj, source, check in [
+        (item, 'name', lambda: item.name),
+        (d, ['name'], lambda: d['name']),
+        (d, ('x', ['name']), lambda: d['name']),
+        (d, lambda obj, val: obj.update(name=val), lambda: d['name']),
+    ]:
+        store(obj, 1, source)
+        assert check() == 1
+        storer(source)(obj, 2)
+        assert check() == 2
+    with pytest.raises(ValueError):
+        store(item, 1, '')
+
+    binding = ListBinding(keys=['name'])
+    binding.store(item, 3, 'name')
+    assert item.name == 3
+    binding.sources(name=['name'])
+    binding.store(d, 4, 'name')
+    assert d == {'name': 4}
+    with pytest.raises(ValueError):
+        binding.store(d, 5)
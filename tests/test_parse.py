@@ -80,3 +80,26 @@ def test_parse(toolkit, wdef, expect_result):
     if 'x' in params['id']:
         params['id'] = params['id'].rsplit('x', 1)[0]
     assert params == expect_result
+
+def test_parse_menu(toolkit):
+    handlers = Mock()
+    menu = ['File >', ['Open', 'Quit #C-Q'], 'About']
+    toolkit.menu_sub = Mock(return_value='submenu')
+    toolkit.menu_command = Mock()
+    toolkit.parse_menu('root', menu, handlers)
+    toolkit.menu_sub.assert_called_once_with('root', id='file', text='File')
+    calls = toolkit.menu_command.call_args_list
+    assert [c.args for c in calls] == [('submenu',), ('submenu',), ('root',)]
+    assert [c.kwargs['id'] for c in calls] == ['open', 'quit', 'about']
+    assert calls[0].kwargs['shortcut'] == 'C-O'
+    assert calls[1].kwargs['shortcut'] == 'C-Q'
+    assert calls[1].kwargs['handler'] is handlers.quit
+    # definition list is not modified
+    assert menu == ['File >', ['Open', 'Quit #C-Q'], 'About']
+
+def test_parse_menu_missing_submenu(toolkit):
+    toolkit.menu_sub = Mock(return_value='submenu')
+    toolkit.menu_command = Mock()
+    with pytest.raises(ValueError):
+        toolkit.parse_menu('root', ['About', 'File >'], Mock())
+    toolkit.menu_sub.assert_not_called()